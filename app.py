@@ -1,115 +1,313 @@
 import streamlit as st
-import hashlib, json, time, os, uuid
-from typing import List, Dict, Any
+import atexit, hashlib, itertools, json, logging, mmap, queue, secrets, threading, time, os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
 # -------------------------
 # Data Storage Setup
 # -------------------------
 DATA_DIR = "data_demo"
-CHAIN_FILE = os.path.join(DATA_DIR, "chain.json")
+CHAIN_FILE = os.path.join(DATA_DIR, "chain.jsonl")
+LEGACY_CHAIN_FILE = os.path.join(DATA_DIR, "chain.json")
 ACCOUNTS_FILE = os.path.join(DATA_DIR, "accounts.json")
 PROPS_FILE = os.path.join(DATA_DIR, "properties.json")
+HISTORY_DIR = os.path.join(DATA_DIR, "history")
 
 def ensure_data_dir():
     if not os.path.exists(DATA_DIR):
         os.makedirs(DATA_DIR)
 
-def hash_object(obj: Any) -> str:
-    s = json.dumps(obj, sort_keys=True).encode()
-    return hashlib.sha256(s).hexdigest()
+# Readers see either the old or the new file, never a torn one.
+def _atomic_write(path: str, data: bytes):
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+def _fsync_dir(path: str):
+    # Makes renames and newly created files durable; POSIX only.
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+# Background writer: a daemon thread drains queued saves in batches, keeping
+# file I/O off the Streamlit request path.
+class Persister:
+    def __init__(self):
+        self._queue: "queue.Queue[Tuple[str, bytes, bool]]" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        threading.Thread(target=self._run, name="persister", daemon=True).start()
+
+    def write(self, path: str, data: bytes):
+        self._check()
+        self._queue.put((path, data, False))
+
+    def append(self, path: str, data: bytes):
+        self._check()
+        self._queue.put((path, data, True))
+
+    def flush(self):
+        # Wait until every queued write is on disk.
+        self._queue.join()
+        self._check()
+
+    def _check(self):
+        # After a failed write the files no longer match memory, so every
+        # later save and flush raises until the process restarts.
+        if self._error is not None:
+            raise RuntimeError("Data files are out of date: a background write failed") from self._error
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                # Once failed, stop writing: later appends would land after a gap.
+                if self._error is None:
+                    self._write_batch(batch)
+            except Exception as e:
+                # Keep the thread alive: a dead writer would hang every flush().
+                logging.getLogger(__name__).exception("Failed to persist %d queued writes", len(batch))
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write_batch(batch: List[Tuple[str, bytes, bool]]):
+        pending: Dict[str, Tuple[bool, bytes]] = {}
+        for path, data, append in batch:
+            if append and path in pending:
+                mode, prev = pending[path]
+                pending[path] = (mode, prev + data)
+            else:
+                pending[path] = (append, data)
+        for path, (append, data) in pending.items():
+            if append:
+                with open(path, "ab") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                _atomic_write(path, data)
+        for d in {os.path.dirname(path) or "." for path in pending}:
+            _fsync_dir(d)
+
+@st.cache_resource
+def get_persister() -> Persister:
+    # cache_resource keeps one writer thread per server process across reruns.
+    persister = Persister()
+    atexit.register(persister.flush)
+    return persister
+
+# hashlib's sha256 is the OpenSSL EVP backend, which dispatches to the
+# SHA-NI / ARMv8 SHA2 instructions at runtime when the CPU has them.
+# Bind it once so hot loops skip the module attribute lookup.
+_sha256 = hashlib.sha256
+
+# Canonical JSON used for hashing. Same output as json.dumps(obj, sort_keys=True)
+# (so existing chain hashes still verify), but the JSONEncoder instance and its
+# option handling are reused instead of being rebuilt by json.dumps per call.
+_canonical_json = json.JSONEncoder(sort_keys=True).encode
+
+# A digest has `difficulty` leading zero hex digits exactly when it sorts below this.
+def difficulty_target(difficulty: int) -> bytes:
+    if difficulty == 0:
+        return b"\xff" * 33  # every 32-byte digest sorts below this
+    return (1 << (256 - 4 * difficulty)).to_bytes(32, "big")
+
+# Tries nonces from `start` until sha256(prefix + nonce + suffix) sorts below `target`.
+def mine_nonce(prefix: bytes, suffix: bytes, target: bytes, start: int = 0) -> Tuple[int, bytes]:
+    copy = _sha256(prefix).copy
+    # Everything the loop touches is a local: no attribute lookups, dict
+    # rebuilds or str round-trips per candidate.
+    for nonce in itertools.count(start):
+        ctx = copy()
+        ctx.update(b"%d%s" % (nonce, suffix))
+        d = ctx.digest()
+        if d < target:
+            return nonce, d
 
 def now_ts():
     return int(time.time())
 
+# 16 hex chars: creation second, then 32 random bits.
+def new_property_id() -> str:
+    return f"{now_ts():08x}{secrets.token_hex(4)}"
+
 # -------------------------
 # Blockchain Classes
 # -------------------------
 class Block:
-    def __init__(self, index:int, previous_hash:str, timestamp:int, transactions:List[Dict], nonce:int=0):
+    def __init__(self, index:int, previous_hash:bytes, timestamp:int, transactions:List[Dict], nonce:int=0):
         self.index = index
         self.previous_hash = previous_hash
         self.timestamp = timestamp
         self.transactions = transactions
         self.nonce = nonce
+        self._nonce_split = None
+        self._hash = None
 
     def to_dict(self):
         return {
             "index": self.index,
-            "previous_hash": self.previous_hash,
+            "previous_hash": self.previous_hash.hex(),
             "timestamp": self.timestamp,
             "transactions": self.transactions,
             "nonce": self.nonce
         }
 
-    def hash(self):
-        return hash_object(self.to_dict())
+    def canonical_bytes(self) -> bytes:
+        prefix, suffix = self.nonce_split()
+        return b"%s%d%s" % (prefix, self.nonce, suffix)
+
+    def hash(self) -> bytes:
+        # Blocks are immutable once mined, so the digest is computed at most
+        # once; proof_of_work seeds it with the winning hash.
+        if self._hash is None:
+            self._hash = _sha256(self.canonical_bytes()).digest()
+        return self._hash
+
+    def nonce_split(self) -> Tuple[bytes, bytes]:
+        # (prefix, suffix) with prefix + str(nonce) + suffix == canonical JSON.
+        if self._nonce_split is None:
+            d = self.to_dict()
+            del d["nonce"]
+            head = _canonical_json({"index": self.index})[:-1]
+            body = _canonical_json(d)
+            self._nonce_split = (head + ', "nonce": ').encode(), body[len(head):].encode()
+        return self._nonce_split
 
 class Blockchain:
     def __init__(self, difficulty=2):
-        self.difficulty = difficulty
+        self.set_difficulty(difficulty)
         self.chain: List[Block] = []
-        if os.path.exists(CHAIN_FILE):
-            self.load()
-        else:
+        self._file_offset = 0  # bytes of CHAIN_FILE already reflected in self.chain
+        self._file_digest = _sha256()  # running sha256 of those bytes
+        # Held by add_block and load: the miner thread appends while script
+        # threads reload, and self.chain and the file position must move together.
+        self._lock = threading.RLock()
+        self.load()
+        if not self.chain:
             self.create_genesis()
 
+    def set_difficulty(self, difficulty: int):
+        self.difficulty = difficulty
+        self._difficulty_target = difficulty_target(difficulty)
+
     def create_genesis(self):
-        genesis = Block(0, "0"*64, now_ts(), [{"type":"genesis","msg":"Genesis Block"}], nonce=0)
-        self.chain = [genesis]
-        self.save()
+        genesis = Block(0, bytes(32), now_ts(), [{"type":"genesis","msg":"Genesis Block"}], nonce=0)
+        with self._lock:
+            self.chain = [genesis]
+            self._track(self.append_block(genesis))
 
     def last_block(self) -> Block:
         return self.chain[-1]
 
     def add_block(self, transactions: List[Dict]) -> Block:
-        index = len(self.chain)
-        previous_hash = self.last_block().hash()
-        block = Block(index, previous_hash, now_ts(), transactions)
-        mined = self.proof_of_work(block)
-        self.chain.append(mined)
-        self.save()
-        return mined
+        with self._lock:
+            index = len(self.chain)
+            previous_hash = self.last_block().hash()
+            block = Block(index, previous_hash, now_ts(), transactions)
+            mined = self.proof_of_work(block)
+            self.chain.append(mined)
+            self._track(self.append_block(mined))
+            return mined
 
     def proof_of_work(self, block: Block) -> Block:
-        prefix = "0" * self.difficulty
-        while True:
-            h = block.hash()
-            if h.startswith(prefix):
-                return block
-            block.nonce += 1
+        prefix, suffix = block.nonce_split()
+        block.nonce, block._hash = mine_nonce(prefix, suffix, self._difficulty_target, block.nonce)
+        return block
 
     def is_chain_valid(self) -> bool:
-        prefix = "0" * self.difficulty
-        for i in range(1, len(self.chain)):
-            curr = self.chain[i]
-            prev = self.chain[i-1]
-            if curr.previous_hash != prev.hash():
+        target = self._difficulty_target
+        # Hash every block exactly once up front; each digest serves both as
+        # the block's own PoW check and as its successor's previous_hash.
+        digests = [b.hash() for b in self.chain]
+        for curr, prev_digest, d in zip(self.chain[1:], digests, digests[1:]):
+            if curr.previous_hash != prev_digest:
                 return False
-            if not curr.hash().startswith(prefix):
+            if d >= target:
                 return False
         return True
 
-    def to_json(self):
-        return [b.to_dict() for b in self.chain]
-
-    def save(self):
+    def append_block(self, block: Block) -> bytes:
+        # Queues one log line and returns it; callers hold self._lock and _track it.
         ensure_data_dir()
-        with open(CHAIN_FILE, "w") as f:
-            json.dump(self.to_json(), f, indent=2)
+        line = (json.dumps(block.to_dict(), separators=(",", ":")) + "\n").encode()
+        get_persister().append(CHAIN_FILE, line)
+        return line
+
+    def _track(self, data: bytes):
+        self._file_offset += len(data)
+        self._file_digest.update(data)
+
+    def _reset(self):
+        self.chain, self._file_offset, self._file_digest = [], 0, _sha256()
 
     def load(self):
-        with open(CHAIN_FILE, "r") as f:
-            raw = json.load(f)
-        self.chain = []
-        for b in raw:
-            block = Block(b["index"], b["previous_hash"], b["timestamp"], b["transactions"], b.get("nonce",0))
-            self.chain.append(block)
+        # Parses only lines past _file_offset, as long as the bytes before it
+        # still hash to _file_digest; any other change rereads the whole log.
+        with self._lock:
+            get_persister().flush()
+            if not os.path.exists(CHAIN_FILE) and os.path.exists(LEGACY_CHAIN_FILE):
+                migrate_legacy_chain()
+            if not os.path.exists(CHAIN_FILE):
+                return
+            with open(CHAIN_FILE, "r+b") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    self._reset()
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if size < self._file_offset or _sha256(mm[:self._file_offset]).digest() != self._file_digest.digest():
+                        self._reset()
+                    start = self._file_offset
+                    while True:
+                        end = mm.find(b"\n", start)
+                        if end < 0:
+                            break
+                        line = mm[start:end]
+                        start = end + 1
+                        if not line.strip():
+                            continue
+                        b = json.loads(line)
+                        block = Block(b["index"], bytes.fromhex(b["previous_hash"]), b["timestamp"], b["transactions"], b.get("nonce",0))
+                        self.chain.append(block)
+                    self._track(mm[self._file_offset:start])
+                if start < size:
+                    # A torn append from a crash; drop it so the next block starts a fresh line.
+                    f.truncate(start)
+
+# Converts a whole-file chain.json from older versions into the JSONL log.
+def migrate_legacy_chain():
+    with open(LEGACY_CHAIN_FILE, "r") as f:
+        raw = json.load(f)
+    lines = "".join(json.dumps(b, separators=(",", ":")) + "\n" for b in raw)
+    _atomic_write(CHAIN_FILE, lines.encode())
+    os.remove(LEGACY_CHAIN_FILE)
 
 # -------------------------
 # Accounts & Properties
 # -------------------------
 def load_accounts():
     ensure_data_dir()
+    get_persister().flush()
     if os.path.exists(ACCOUNTS_FILE):
         with open(ACCOUNTS_FILE, "r") as f:
             return json.load(f)
@@ -124,28 +322,107 @@ def load_accounts():
 
 def save_accounts(accounts):
     ensure_data_dir()
-    with open(ACCOUNTS_FILE, "w") as f:
-        json.dump(accounts, f, indent=2)
+    get_persister().write(ACCOUNTS_FILE, json.dumps(accounts, separators=(",", ":")).encode())
 
 def load_properties():
     ensure_data_dir()
+    get_persister().flush()
     if os.path.exists(PROPS_FILE):
         with open(PROPS_FILE, "r") as f:
-            return json.load(f)
+            props = json.load(f)
+        if migrate_inline_history(props):
+            save_properties(props)
+        for pid in props:
+            if os.path.exists(history_path(pid)):
+                truncate_torn_tail(history_path(pid))
+        get_history_tails().clear()
+        return props
     else:
         save_properties({})
         return {}
 
 def save_properties(props):
     ensure_data_dir()
-    with open(PROPS_FILE, "w") as f:
-        json.dump(props, f, indent=2)
+    get_persister().write(PROPS_FILE, json.dumps(props, separators=(",", ":")).encode())
+
+# Property history lives in one append-only JSONL file per property, so
+# properties.json only holds current state and stays small as history grows.
+def history_path(property_id: str) -> str:
+    return os.path.join(HISTORY_DIR, f"{property_id}.jsonl")
+
+HISTORY_TAIL = 5  # events shown per property
+
+@st.cache_resource
+def get_history_tails() -> Dict[str, deque]:
+    # Last HISTORY_TAIL events per property, read from disk once and then kept
+    # current by append_history, so rendering never waits on queued writes.
+    return {}
+
+def history_tail(property_id: str) -> deque:
+    tails = get_history_tails()
+    tail = tails.get(property_id)
+    if tail is None:
+        events = [json.loads(line) for line in read_last_n_lines(history_path(property_id), HISTORY_TAIL)]
+        tail = tails.setdefault(property_id, deque(events, maxlen=HISTORY_TAIL))
+    return tail
+
+def append_history(property_id: str, event: Dict):
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    tail = history_tail(property_id)  # before queueing, so the disk read cannot see this event
+    line = json.dumps(event, separators=(",", ":")) + "\n"
+    get_persister().append(history_path(property_id), line.encode())
+    tail.append(event)
+
+def truncate_torn_tail(path: str, chunk_size: int = 4096):
+    # Cuts a last line left without its newline by a crash mid-append.
+    with open(path, "r+b") as f:
+        size = pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos = f.seek(pos - step)
+            nl = f.read(step).rfind(b"\n")
+            if nl >= 0:
+                pos += nl + 1
+                break
+        if pos < size:
+            f.truncate(pos)
+
+def read_last_n_lines(path: str, n: int, chunk_size: int = 4096) -> List[bytes]:
+    # Reads backwards from EOF, so the cost does not grow with the file.
+    if n <= 0 or not os.path.exists(path):
+        return []
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        buf = b""
+        # n + 1 newlines guarantee n complete lines, even after a torn last line.
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(chunk_size, pos)
+            pos = os.lseek(fd, pos - step, os.SEEK_SET)
+            buf = os.read(fd, step) + buf
+    finally:
+        os.close(fd)
+    return buf[:buf.rfind(b"\n") + 1].splitlines()[-n:]
+
+# Moves `history` lists that older versions stored inside properties.json.
+def migrate_inline_history(props) -> bool:
+    changed = False
+    for pid, prop in props.items():
+        if "history" not in prop:
+            continue
+        events = prop.pop("history")
+        if not os.path.exists(history_path(pid)):
+            os.makedirs(HISTORY_DIR, exist_ok=True)
+            lines = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in events)
+            _atomic_write(history_path(pid), lines.encode())
+        changed = True
+    return changed
 
 # -------------------------
 # Property Logic
 # -------------------------
 def create_property(props, owner_id, title, description):
-    pid = str(uuid.uuid4())
+    pid = new_property_id()
     prop = {
         "id": pid,
         "title": title,
@@ -153,19 +430,19 @@ def create_property(props, owner_id, title, description):
         "owner": owner_id,
         "created_at": now_ts(),
         "rented_to": None,
-        "history": [
-            {"type":"created","owner":owner_id,"timestamp":now_ts()}
-        ]
     }
     props[pid] = prop
     save_properties(props)
+    append_history(pid, {"type":"created","owner":owner_id,"timestamp":now_ts()})
     return prop
 
-def transfer_property(props, property_id, new_owner_id, blockchain:Blockchain):
+def transfer_property(props, property_id, new_owner_id, blockchain:Blockchain, actor_id):
     if property_id not in props:
         return False, "Property not found"
     prop = props[property_id]
     prev_owner = prop["owner"]
+    if actor_id != prev_owner:
+        return False, "Only the owner can transfer ownership."
     if new_owner_id == prev_owner:
         return False, "Cannot transfer to same owner"
 
@@ -180,15 +457,17 @@ def transfer_property(props, property_id, new_owner_id, blockchain:Blockchain):
 
     prop["owner"] = new_owner_id
     prop["rented_to"] = None
-    prop["history"].append({"type":"transfer","from":prev_owner,"to":new_owner_id,"timestamp":now_ts(),"block_index": block.index})
+    append_history(property_id, {"type":"transfer","from":prev_owner,"to":new_owner_id,"timestamp":now_ts(),"block_index": block.index})
     save_properties(props)
     return True, block
 
-def rent_property(props, property_id, renter_id, blockchain:Blockchain):
+def rent_property(props, property_id, renter_id, blockchain:Blockchain, actor_id):
     if property_id not in props:
         return False, "Property not found"
     prop = props[property_id]
     owner = prop["owner"]
+    if actor_id != owner:
+        return False, "Only the owner can rent out this property."
     if renter_id == owner:
         return False, "Owner cannot rent to themselves"
     
@@ -201,10 +480,16 @@ def rent_property(props, property_id, renter_id, blockchain:Blockchain):
     }
     block = blockchain.add_block([tx])
     prop["rented_to"] = renter_id
-    prop["history"].append({"type":"rent","owner":owner,"renter":renter_id,"timestamp":now_ts(),"block_index": block.index})
+    append_history(property_id, {"type":"rent","owner":owner,"renter":renter_id,"timestamp":now_ts(),"block_index": block.index})
     save_properties(props)
     return True, block
 
+def register_property(props, owner_id, title, description, blockchain:Blockchain):
+    prop = create_property(props, owner_id, title, description)
+    tx = {"type":"create_property","property_id":prop["id"],"owner":owner_id,"timestamp":now_ts()}
+    block = blockchain.add_block([tx])
+    return True, block
+
 # -------------------------
 # Streamlit UI
 # -------------------------
@@ -212,16 +497,74 @@ st.set_page_config(page_title="PropertyChain Simplified", layout="wide")
 st.title("🏠 PropertyChain — Simplified Property Management System")
 st.caption("Create, transfer, and rent properties on a blockchain demo. No money, just ownership tracking.")
 
+# Loaded once per server process instead of on every rerun. All mutations
+# update these objects in place and persist them, so the cache stays current;
+# the sidebar Reload button re-reads them in place to pick up edits made
+# outside the app.
+@st.cache_resource
+def get_blockchain() -> Blockchain:
+    return Blockchain(difficulty=2)
+
+@st.cache_resource
+def get_accounts() -> Dict[str, Dict]:
+    return load_accounts()
+
+@st.cache_resource
+def get_properties() -> Dict[str, Dict]:
+    return load_properties()
+
+@st.cache_resource
+def get_miner() -> ThreadPoolExecutor:
+    # A single worker mines blocks strictly in order, off the script thread.
+    # Ownership checks run inside the jobs, since the miner is shared by all
+    # sessions and an owner can change between a click and its job running.
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="miner")
+
+def start_mining(describe, fn, *args):
+    # fn runs on the miner and returns (ok, block_or_error); describe(block) builds the success message.
+    future = get_miner().submit(fn, *args)
+    st.session_state["mining"] = (describe, future)
+    st.rerun()
+
+def refresh_in_place(cached: Dict, fresh: Dict):
+    for key in cached.keys() - fresh.keys():
+        del cached[key]
+    cached.update(fresh)
+
+def reload_data(blockchain: Blockchain, accounts: Dict, props: Dict):
+    # Runs as a miner job, so it is ordered after every block already queued.
+    blockchain.load()
+    refresh_in_place(accounts, load_accounts())
+    refresh_in_place(props, load_properties())
+    return True, None
+
 ensure_data_dir()
-blockchain = Blockchain(difficulty=2)
-accounts = load_accounts()
-properties = load_properties()
+blockchain = get_blockchain()
+accounts = get_accounts()
+properties = get_properties()
+name_of = {uid: a['name'] for uid, a in accounts.items()}
+
+# Mining job started by an earlier rerun
+mining = False
+job = st.session_state.get("mining")
+if job is not None:
+    describe, future = job
+    if future.done():
+        del st.session_state["mining"]
+        ok, res = future.result()
+        if ok:
+            st.success(describe(res))
+        else:
+            st.error(res)
+    else:
+        mining = True
+        st.status("Mining block…", state="running")
 
 # Sidebar: user selection
 st.sidebar.header("Select Active User")
-user_id = st.sidebar.selectbox("Active Account", options=list(accounts.keys()), format_func=lambda x: accounts[x]['name'])
-if st.sidebar.button("Reload"):
-    st.rerun()
+user_id = st.sidebar.selectbox("Active Account", options=list(accounts.keys()), format_func=name_of.get)
+if st.sidebar.button("Reload", disabled=mining):
+    start_mining(lambda _: "Reloaded data from disk.", reload_data, blockchain, accounts, properties)
 
 # Sidebar: create new user
 st.sidebar.markdown("---")
@@ -233,6 +576,7 @@ if st.sidebar.button("Create User"):
         st.sidebar.error("User ID already exists.")
     else:
         accounts[new_id] = {"id": new_id, "name": new_name}
+        name_of[new_id] = new_name
         save_accounts(accounts)
         st.sidebar.success(f"User {new_name} added!")
         st.rerun()
@@ -246,14 +590,15 @@ with tab1:
     if not properties:
         st.info("No properties yet. Create one in the next tab.")
     else:
-        for pid, p in properties.items():
+        # Snapshot: the miner thread may add a property while we render.
+        for pid, p in list(properties.items()):
             st.subheader(f"{p['title']}")
-            st.write(f"**Owner:** {accounts.get(p['owner'], {'name':'Unknown'})['name']} ({p['owner']})")
+            st.write(f"**Owner:** {name_of.get(p['owner'], 'Unknown')} ({p['owner']})")
             if p.get('rented_to'):
-                st.write(f"**Currently rented to:** {accounts.get(p['rented_to'], {'name':'Unknown'})['name']} ({p['rented_to']})")
+                st.write(f"**Currently rented to:** {name_of.get(p['rented_to'], 'Unknown')} ({p['rented_to']})")
             st.write(f"Description: {p['description']}")
             st.write("History:")
-            for h in reversed(p['history'][-5:]):
+            for h in reversed(history_tail(pid).copy()):
                 st.write(h)
             st.markdown("---")
 
@@ -263,13 +608,10 @@ with tab2:
     with st.form("create_property"):
         title = st.text_input("Property Title", "Cozy Apartment")
         description = st.text_area("Description", "2BHK with balcony")
-        submitted = st.form_submit_button("Create Property")
+        submitted = st.form_submit_button("Create Property", disabled=mining)
         if submitted:
-            prop = create_property(properties, user_id, title, description)
-            tx = {"type":"create_property","property_id":prop["id"],"owner":user_id,"timestamp":now_ts()}
-            block = blockchain.add_block([tx])
-            st.success(f"Property created by {user_id}. Block #{block.index} mined.")
-            st.rerun()
+            start_mining(lambda block, owner=user_id: f"Property created by {owner}. Block #{block.index} mined.",
+                         register_property, properties, user_id, title, description, blockchain)
 
 # --- Transfer / Rent
 with tab3:
@@ -280,34 +622,20 @@ with tab3:
     else:
         selected_pid = st.selectbox("Select Property", options=list(properties.keys()), format_func=lambda x: properties[x]['title'])
         prop = properties[selected_pid]
-        st.write(f"Owner: {accounts[prop['owner']]['name']} ({prop['owner']})")
+        st.write(f"Owner: {name_of.get(prop['owner'], 'Unknown')} ({prop['owner']})")
         st.write(f"Rented to: {prop.get('rented_to') if prop.get('rented_to') else 'None'}")
 
         st.markdown("#### Transfer Ownership")
         new_owner = st.selectbox("Select New Owner", options=[u for u in accounts.keys() if u != prop['owner']])
-        if st.button("Transfer Ownership"):
-            if user_id != prop['owner']:
-                st.error("Only the owner can transfer ownership.")
-            else:
-                ok, res = transfer_property(properties, selected_pid, new_owner, blockchain)
-                if ok:
-                    st.success(f"Transferred to {new_owner}. Block #{res.index} mined.")
-                    st.rerun()
-                else:
-                    st.error(res[1])
+        if st.button("Transfer Ownership", disabled=mining):
+            start_mining(lambda block, new_owner=new_owner: f"Transferred to {new_owner}. Block #{block.index} mined.",
+                         transfer_property, properties, selected_pid, new_owner, blockchain, user_id)
 
         st.markdown("#### Rent Property to Another User")
         renter = st.selectbox("Select Renter", options=[u for u in accounts.keys() if u != prop['owner']])
-        if st.button("Give on Rent"):
-            if user_id != prop['owner']:
-                st.error("Only the owner can rent out this property.")
-            else:
-                ok, res = rent_property(properties, selected_pid, renter, blockchain)
-                if ok:
-                    st.success(f"Property rented to {renter}. Block #{res.index} mined.")
-                    st.rerun()
-                else:
-                    st.error(res[1])
+        if st.button("Give on Rent", disabled=mining):
+            start_mining(lambda block, renter=renter: f"Property rented to {renter}. Block #{block.index} mined.",
+                         rent_property, properties, selected_pid, renter, blockchain, user_id)
 
 # --- Blockchain Explorer
 with tab4:
@@ -323,9 +651,14 @@ with tab4:
     for b in reversed(last_blocks):
         st.subheader(f"Block #{b.index}")
         st.write("Timestamp:", time.ctime(b.timestamp))
-        st.write("Prev hash:", b.previous_hash)
+        st.write("Prev hash:", b.previous_hash.hex())
         st.write("Nonce:", b.nonce)
         st.write("Transactions:")
         for t in b.transactions:
             st.json(t)
         st.markdown("---")
+
+# Keep polling until the miner finishes; the page stays usable meanwhile.
+if mining:
+    time.sleep(0.05)
+    st.rerun()